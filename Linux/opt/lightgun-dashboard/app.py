@@ -1,19 +1,88 @@
 #!/usr/bin/env python3
 import os
 import re
+import gzip
 import time
-import glob
+import shutil
+import functools
 import threading
 import subprocess
 import json
+import errno
+import fcntl
 import xml.etree.ElementTree as ET
-from collections import OrderedDict
-from typing import List, Dict, Tuple
+from collections import deque
+from operator import itemgetter
+from typing import Deque, List, Dict, Tuple
 
-from flask import Flask, jsonify, render_template_string, send_from_directory, request
+from flask import Flask, jsonify, send_file, send_from_directory, request
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 
+try:
+    from pystemd.systemd1 import Unit as SystemdUnit
+except ImportError:
+    SystemdUnit = None
+
+try:
+    from systemd import journal as sd_journal
+except ImportError:
+    sd_journal = None
+
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+XML = LET if LET is not None else ET
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    # jsonify() and request.get_json() through orjson's C codec; falls back
+    # to Flask's default handler for anything orjson can't serialize natively.
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+GZIP_MIN_SIZE = 500
+
+
+@app.after_request
+def _gzip_json(response):
+    # Only buffered JSON bodies; files from send_file keep going out via
+    # sendfile. Level 1 gets most of the ratio for very little CPU.
+    if (
+        response.mimetype != "application/json"
+        or response.direct_passthrough
+        or response.status_code != 200
+        or "Content-Encoding" in response.headers
+        or request.accept_encodings["gzip"] <= 0
+    ):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=1))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
 
 # ---------------------------
 # Services & system utilities
@@ -39,6 +108,18 @@ DEFAULT_PLATFORM = "ps2"
 # Sinden log
 # ---------------------------
 SINDEN_LOGFILE = "/home/sinden/Lightgun/log/sinden.log"
+LOG_TAIL_BYTES = 256 * 1024
+
+
+def _read_log_tail(path: str, limit: int = LOG_TAIL_BYTES) -> str:
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - limit))
+        data = f.read()
+    if size > limit:
+        # Drop the partial first line of the window.
+        data = data.split(b"\n", 1)[-1]
+    return data.decode("utf-8", errors="replace")
 
 # ---------------------------
 # SindenPS Version
@@ -55,19 +136,90 @@ def _read_sindenps_version():
 # ===========================
 # Systemd helpers
 # ===========================
-def get_status(service: str) -> str:
+_STATUS_TTL = 0.5
+_STATUS_CACHE: Dict[str, Tuple[float, str]] = {}
+_SYSTEMD_UNITS: Dict[str, "SystemdUnit"] = {}
+_SYSTEMD_LOCK = threading.Lock()
+_ACTIVE_STATES = frozenset((
+    "active", "reloading", "inactive", "failed", "activating",
+    "deactivating", "maintenance", "refreshing", "unknown",
+))
+
+
+def _query_status_dbus(service: str) -> str:
+    # sd-bus connections are not thread-safe; gunicorn runs threaded workers.
+    with _SYSTEMD_LOCK:
+        unit = _SYSTEMD_UNITS.get(service)
+        if unit is None:
+            unit = SystemdUnit(service.encode())
+            unit.load()
+            _SYSTEMD_UNITS[service] = unit
+        return unit.Unit.ActiveState.decode()
+
+
+def _systemctl_is_active(services: List[str]) -> Dict[str, str]:
     try:
         out = subprocess.check_output(
-            [SYSTEMCTL, "is-active", service],
+            [SYSTEMCTL, "is-active", *services],
             stderr=subprocess.STDOUT
         )
-        return out.decode().strip()
 
     except subprocess.CalledProcessError as e:
-        return e.output.decode().strip()
+        # Non-zero unless every unit is active, but one state is still
+        # printed per unit.
+        out = e.output
 
     except Exception:
-        return "unknown"
+        return {s: "unknown" for s in services}
+
+    text = out.decode().strip()
+    if len(services) == 1:
+        return {services[0]: text}
+    lines = text.splitlines()
+    if len(lines) != len(services) or not _ACTIVE_STATES.issuperset(lines):
+        # An error message rather than per-unit states; ask one at a time.
+        return {s: _systemctl_is_active([s])[s] for s in services}
+    return dict(zip(services, lines))
+
+
+def _query_statuses(services: List[str]) -> Dict[str, str]:
+    # Reading ActiveState over D-Bus needs no privileges; start/stop still
+    # go through sudo systemctl so the sudoers allow-list stays in charge.
+    statuses: Dict[str, str] = {}
+    pending: List[str] = []
+    for service in services:
+        if SystemdUnit is not None:
+            try:
+                statuses[service] = _query_status_dbus(service)
+                continue
+            except Exception:
+                _SYSTEMD_UNITS.pop(service, None)
+        pending.append(service)
+    if pending:
+        statuses.update(_systemctl_is_active(pending))
+    return statuses
+
+
+def get_statuses(services: List[str]) -> Dict[str, str]:
+    # Dashboards poll this; coalesce bursts into one systemctl fork.
+    now = time.monotonic()
+    statuses: Dict[str, str] = {}
+    stale: List[str] = []
+    for service in services:
+        hit = _STATUS_CACHE.get(service)
+        if hit and now - hit[0] < _STATUS_TTL:
+            statuses[service] = hit[1]
+        else:
+            stale.append(service)
+    if stale:
+        for service, status in _query_statuses(stale).items():
+            _STATUS_CACHE[service] = (now, status)
+            statuses[service] = status
+    return {s: statuses[s] for s in services}
+
+
+def get_status(service: str) -> str:
+    return get_statuses([service])[service]
 
 
 def control_service(service: str, action: str) -> bool:
@@ -77,6 +229,8 @@ def control_service(service: str, action: str) -> bool:
     except subprocess.CalledProcessError as e:
         print("CONTROL ERROR:", e.output.decode(errors="replace"))
         return False
+    finally:
+        _STATUS_CACHE.pop(service, None)
 
 
 # ===========================
@@ -144,8 +298,8 @@ def _read_fan_curve():
         if not os.path.exists(FAN_CURVE_CONFIG):
             return DEFAULT_FAN_CURVE.copy()
 
-        with open(FAN_CURVE_CONFIG, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(FAN_CURVE_CONFIG, "rb") as f:
+            data = app.json.loads(f.read())
 
         return _validate_fan_curve({
             "tempSteps": data.get("tempSteps", DEFAULT_FAN_CURVE["tempSteps"]),
@@ -226,6 +380,8 @@ def system_power_action(action: str) -> bool:
 # ===========================
 UPDATE_SCRIPT = "/opt/sinden/driver-update.sh"
 UPDATE_LOGF = "/var/log/sindenps-update.log"
+UPDATE_TIMEOUT = 1800
+UPDATE_DRAIN_TIMEOUT = 5
 VERSION_FILE = "/home/sinden/Lightgun/VERSION"
 SINDENPS_UPDATE_LOG = "/var/log/platform-update.log"
 SINDENPS_LOCK = "/tmp/sindenps-update.lock"
@@ -252,10 +408,21 @@ def set_icon_set(value):
     with open(ICONSET_FILE, "w", encoding="utf-8") as f:
         f.write(value)
 
+# One (mtime_ns, value) tuple swapped in by a single store, so a reader on
+# another thread never pairs one file's mtime with another's contents.
+_VERSION_CACHE: Dict[str, Tuple[int, str]] = {"entry": (-1, "")}
+
+
 def _read_version_marker():
     try:
+        st = os.stat(VERSION_FILE)
+        mtime_ns, value = _VERSION_CACHE["entry"]
+        if st.st_mtime_ns == mtime_ns:
+            return value
         with open(VERSION_FILE, "r", encoding="utf-8") as f:
-            return (f.read().strip() or "")
+            value = f.read().strip() or ""
+        _VERSION_CACHE["entry"] = (st.st_mtime_ns, value)
+        return value
     except Exception:
         return ""
 
@@ -267,16 +434,58 @@ UPDATE_STATE = {
     "latest": None,
     "message": ""
 }
-UPDATE_LOG_RING: List[str] = []
+UPDATE_LOG_RING: Deque[str] = deque(maxlen=2000)
+UPDATE_CHANNELS = frozenset(("latest", "beta", "previous", "ubuntu"))
+# flock rather than threading.Lock: gunicorn runs two worker processes and
+# only one update may run across both. Kept in the app directory, which the
+# dashboard user owns, so a stale root-owned file in /tmp cannot block it.
+UPDATE_LOCK_FILE = "/opt/lightgun-dashboard/.update.lock"
+
+
+def _try_update_lock():
+    fd = os.open(UPDATE_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
 
 
 def _append_log(lines: str):
     if not lines:
         return
-    for ln in lines.splitlines():
-        UPDATE_LOG_RING.append(ln)
-    if len(UPDATE_LOG_RING) > 2000:
-        UPDATE_LOG_RING.pop(0)
+    UPDATE_LOG_RING.extend(lines.splitlines())
+
+
+def _drain_update_output(stream):
+    try:
+        for line in stream:
+            _append_log(line)
+    except (OSError, ValueError):
+        pass
+    finally:
+        stream.close()
+
+
+def _kill_update(proc):
+    # sudo runs as root, so the session has to be killed through sudo too.
+    try:
+        subprocess.run(
+            [SUDO, "-n", "kill", "-KILL", "--", f"-{proc.pid}"],
+            capture_output=True,
+            timeout=10,
+        )
+    except Exception:
+        pass
+    try:
+        proc.kill()
+    except OSError:
+        pass
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        pass
 
 
 def _set_state(st, msg=""):
@@ -335,17 +544,7 @@ def fan_status():
             "status": "not-installed"
         })
 
-    try:
-        out = subprocess.check_output(
-            [SYSTEMCTL, "is-active", service_name],
-            stderr=subprocess.STDOUT
-        )
-        status = out.decode().strip()
-
-    except subprocess.CalledProcessError as e:
-        status = e.output.decode(errors="replace").strip()
-        if not status:
-            status = "inactive"
+    status = get_status(service_name) or "inactive"
 
     return jsonify({
         "installed": True,
@@ -383,8 +582,7 @@ def api_update_status():
 @app.route("/api/update/check")
 def api_update_check():
     channel = (request.args.get("channel") or "latest").lower()
-    allowed = {"latest", "beta", "previous", "ubuntu"}
-    if channel not in allowed:
+    if channel not in UPDATE_CHANNELS:
         _set_state("error", f"unsupported channel: {channel}")
         return jsonify({"ok": False, "error": f"unsupported channel: {channel}"}), 400
     UPDATE_STATE["latest"] = {"version": channel, "notesUrl": "", "asset": None}
@@ -396,21 +594,37 @@ def api_update_check():
 def api_update_apply():
     data = request.get_json(force=True) or {}
     channel = (data.get("channel") or "latest").lower()
-    allowed = {"latest", "beta", "previous", "ubuntu"}
-    if channel not in allowed:
+    if channel not in UPDATE_CHANNELS:
         _set_state("error", f"unsupported channel: {channel}")
         return jsonify({"ok": False, "error": f"unsupported channel: {channel}"}), 400
 
+    lock_fd = None
     try:
+        lock_fd = _try_update_lock()
+        if lock_fd is None:
+            return jsonify({"ok": False, "error": "Busy"}), 409
+
         _set_state("applying", f"running {UPDATE_SCRIPT} for {channel}")
-        proc = subprocess.run(
+        deadline = time.monotonic() + UPDATE_TIMEOUT
+        proc = subprocess.Popen(
             [SUDO, "-n", "env", f"VERSION={channel}", UPDATE_SCRIPT],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            timeout=1800,
+            errors="replace",
+            bufsize=1,
+            start_new_session=True,
         )
-        _append_log(proc.stdout)
+        # Drain the pipe off-thread: a child of the script can keep it open
+        # after sudo exits, so EOF must not gate the deadline.
+        reader = threading.Thread(target=_drain_update_output, args=(proc.stdout,), daemon=True)
+        reader.start()
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _kill_update(proc)
+            raise
+        reader.join(timeout=UPDATE_DRAIN_TIMEOUT)
 
         if proc.returncode != 0:
             _set_state("error", "update script failed")
@@ -425,6 +639,9 @@ def api_update_apply():
     except Exception as e:
         _set_state("error", str(e))
         return jsonify({"ok": False, "error": str(e)}), 500
+    finally:
+        if lock_fd is not None:
+            os.close(lock_fd)
 
       
 def supports_player2(platform):
@@ -446,8 +663,7 @@ def supports_player2(platform):
 @app.route("/api/update/logs")
 def api_update_logs():
     try:
-        with open(UPDATE_LOGF, "r", encoding="utf-8", errors="replace") as f:
-            return jsonify({"logs": f.read()})
+        return jsonify({"logs": _read_log_tail(UPDATE_LOGF)})
     except Exception as e:
         if UPDATE_LOG_RING:
             return jsonify({"logs": "\n".join(UPDATE_LOG_RING)})
@@ -461,8 +677,11 @@ FIRMWARE_LIBRARY_DIR = "/home/sinden/Firmware"
 FIRMWARE_DEFAULT_MCU = "atmega328p"
 FIRMWARE_DEFAULT_PROGRAMMER = "arduino"
 FIRMWARE_DEFAULT_BAUD = "57600"
-FIRMWARE_LOG_RING: List[str] = []
+FIRMWARE_LOG_RING: Deque[str] = deque(maxlen=2000)
 FIRMWARE_LOCK = threading.Lock()
+# Guards FIRMWARE_STATE so status polls never see a state from one update
+# paired with the message or file from another.
+FIRMWARE_STATE_LOCK = threading.Lock()
 
 FIRMWARE_STATE = {
     "ok": True,
@@ -478,15 +697,14 @@ FIRMWARE_STATE = {
 def _fw_append_log(text: str):
     if not text:
         return
-    for line in text.splitlines():
-        FIRMWARE_LOG_RING.append(line)
+    FIRMWARE_LOG_RING.extend(text.splitlines())
 
 
 def _fw_set_state(state: str, message: str = "", **extra):
-    FIRMWARE_STATE["state"] = state
-    FIRMWARE_STATE["message"] = message
-    for k, v in extra.items():
-        FIRMWARE_STATE[k] = v
+    with FIRMWARE_STATE_LOCK:
+        FIRMWARE_STATE["state"] = state
+        FIRMWARE_STATE["message"] = message
+        FIRMWARE_STATE.update(extra)
 
 
 def _fw_detect_port() -> str:
@@ -551,7 +769,8 @@ def _fw_flash_hex(path: str, port: str, baud: str):
     _fw_append_log(result.stdout or "")
 
     if result.returncode == 0:
-        FIRMWARE_STATE["baud"] = baud
+        with FIRMWARE_STATE_LOCK:
+            FIRMWARE_STATE["baud"] = baud
 
     return result
 
@@ -601,7 +820,9 @@ def get_pi_model():
 
 @app.route("/api/firmware/status")
 def api_firmware_status():
-    return jsonify({"ok": True, **FIRMWARE_STATE})
+    with FIRMWARE_STATE_LOCK:
+        snapshot = dict(FIRMWARE_STATE)
+    return jsonify({"ok": True, **snapshot})
 
 
 @app.route("/api/firmware/logs")
@@ -721,7 +942,7 @@ def api_firmware_flash():
 # ===========================
 @app.route("/api/services")
 def list_services():
-    return jsonify({s: get_status(s) for s in SERVICES})
+    return jsonify(get_statuses(SERVICES))
 
 @app.route("/api/platform", methods=["GET"])
 def api_platform():
@@ -921,6 +1142,48 @@ def api_adapters():
         "adapters": adapters
     })
 
+SERVICE_LOG_LINES = 200
+
+
+def _journal_tail(service: str, lines: int = SERVICE_LOG_LINES):
+    # Reads the unit's journal directly instead of forking `systemctl status`.
+    # Readers are not thread-safe, so each request opens its own. Returns
+    # None when nothing is visible (e.g. the user is not in systemd-journal)
+    # so the caller can fall back to systemctl.
+    reader = sd_journal.Reader()
+    try:
+        # Like `journalctl -u`: the unit's own output, or systemd's
+        # start/stop messages about it, from this boot.
+        reader.add_match(_SYSTEMD_UNIT=service)
+        reader.add_disjunction()
+        reader.add_match(UNIT=service, _PID="1")
+        reader.add_conjunction()
+        reader.this_boot()
+        reader.seek_tail()
+        entries = []
+        for _ in range(lines):
+            entry = reader.get_previous()
+            if not entry:
+                break
+            entries.append(entry)
+    finally:
+        reader.close()
+    if not entries:
+        return None
+
+    out = [f"{service} - {get_status(service) or 'unknown'}", ""]
+    for entry in reversed(entries):
+        msg = entry.get("MESSAGE", "")
+        if isinstance(msg, bytes):
+            msg = msg.decode(errors="replace")
+        ts = entry.get("__REALTIME_TIMESTAMP")
+        stamp = ts.strftime("%b %d %H:%M:%S") if ts else ""
+        ident = entry.get("SYSLOG_IDENTIFIER", service)
+        pid = entry.get("_PID")
+        out.append(f"{stamp} {ident}[{pid}]: {msg}" if pid else f"{stamp} {ident}: {msg}")
+    return "\n".join(out)
+
+
 @app.route("/api/logs/<service>")
 def service_logs(service):
 
@@ -933,6 +1196,14 @@ def service_logs(service):
             "error": "unknown service"
         }), 400
 
+    if sd_journal is not None:
+        try:
+            logs = _journal_tail(service)
+            if logs is not None:
+                return jsonify({"logs": logs})
+        except Exception:
+            pass
+
     try:
         out = subprocess.check_output(
             [
@@ -962,12 +1233,20 @@ def service_logs(service):
 @app.route("/api/sinden-log")
 def sinden_log():
     try:
-        with open(SINDEN_LOGFILE, "r", encoding="utf-8", errors="replace") as f:
-            return jsonify({"logs": f.read()})
+        return jsonify({"logs": _read_log_tail(SINDEN_LOGFILE)})
     except Exception as e:
         return jsonify({"logs": f"Error reading log: {e}"})
 
 
+@app.route("/api/sinden-log/raw")
+def sinden_log_raw():
+    # Whole log as text/plain; sent with sendfile and honours Range/304.
+    try:
+        return send_file(SINDEN_LOGFILE, mimetype="text/plain", conditional=True)
+    except FileNotFoundError:
+        return jsonify({"ok": False, "error": "Log not found"}), 404
+
+
 @app.route("/api/system/<action>", methods=["POST"])
 def api_system_action(action):
     if action not in ("reboot", "shutdown"):
@@ -978,20 +1257,79 @@ def api_system_action(action):
 # ===========================
 # XML config helpers (PS1/PS2)
 # ===========================
+_PLATFORMS = frozenset(CONFIG_PATHS)
+
+# (backup_dir, cfg_base, live_path, profiles_dir) per platform; the
+# backups/ and profiles/ folders sit next to each live config.
+_PLATFORM_META: Dict[str, Tuple[str, str, str, str]] = {
+    platform: (
+        os.path.join(os.path.dirname(path), "backups"),
+        os.path.basename(path),
+        path,
+        os.path.join(os.path.dirname(path), "profiles"),
+    )
+    for platform, path in CONFIG_PATHS.items()
+}
+
+
+@functools.lru_cache(maxsize=16)
 def _resolve_platform(p: str) -> str:
     p = (p or "").lower()
-    return p if p in CONFIG_PATHS else DEFAULT_PLATFORM
+    return p if p in _PLATFORMS else DEFAULT_PLATFORM
 
 
 def _ensure_stub(path: str) -> None:
-    if not os.path.exists(path):
+    # O_EXCL: one syscall when the file exists, and no race between two
+    # workers creating it.
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        return
+    except FileNotFoundError:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write('<?xml version="1.0" encoding="utf-8"?>\n<configuration><appSettings></appSettings></configuration>\n')
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            return
+    with open(fd, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<configuration><appSettings></appSettings></configuration>\n')
+
+
+def _tmp_path_for(path: str) -> str:
+    # Same directory (so os.replace is a rename) and unique per worker thread.
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _fsync_file(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Errors meaning the filesystem cannot hardlink here, not that dst is taken.
+_NO_LINK_ERRNOS = frozenset((errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP))
+
+
+def _link_or_copy(src: str, dst: str) -> bool:
+    # A hardlink is only a safe backup if src is then replaced by rename,
+    # never rewritten in place; returns True when a link was made. Never
+    # overwrites dst: FileExistsError is left to the caller.
+    try:
+        os.link(src, dst)
+        return True
+    except OSError as e:
+        if e.errno not in _NO_LINK_ERRNOS:
+            raise
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        shutil.copyfileobj(fsrc, fdst)
+    return False
 
 
 def _load_config_tree(path: str) -> ET.ElementTree:
-    _ensure_stub(path)
+    if LET is not None:
+        return LET.parse(path, LET.XMLParser(remove_blank_text=False, remove_comments=False))
     parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True, insert_pis=True))
     return ET.parse(path, parser=parser)
 
@@ -1000,87 +1338,116 @@ def _appsettings_root(tree: ET.ElementTree) -> ET.Element:
     root = tree.getroot()
     appsettings = root.find("appSettings")
     if appsettings is None:
-        appsettings = ET.SubElement(root, "appSettings")
+        appsettings = XML.SubElement(root, "appSettings")
     return appsettings
 
 
-_ADD_TAG_RE = re.compile(r"<add\b[^>]*>", re.IGNORECASE)
+# One <add .../> tag with its key and (optional) value attribute captured in
+# a single match; lookaheads keep attribute order irrelevant. The writer works
+# on raw bytes, so these patterns are bytes patterns.
+_ADD_KV_RE = re.compile(
+    rb"""<add\b
+        (?=[^>]*?\bkey\s*=\s*(?P<kq>['"])(?P<key>[^>]*?)(?P=kq))
+        (?:(?=[^>]*?\bvalue\s*=\s*(?P<vq>['"])(?P<val>[^>]*?)(?P=vq)))?
+        [^>]*>""",
+    re.IGNORECASE | re.VERBOSE,
+)
+_ADD_INDENT_RE = re.compile(rb"^([ \t]*)<add\b", re.MULTILINE)
+_APPSETTINGS_CLOSE_RE = re.compile(rb"</appSettings\s*>", re.IGNORECASE)
+
+
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"})
 
 
 def _xml_escape_attr(s: str) -> str:
-    if s is None:
-        return ""
-    s = str(s)
-    return (s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;").replace("'", "&apos;"))
+    return "" if s is None else s.translate(_XML_ESCAPE)
 
 
 def _build_desired_map(p1_list, p2_list) -> Dict[str, str]:
+    # Keys and values are normalised to str here, so the writer can rely on it.
     desired: Dict[str, str] = {}
-    for item in (p1_list or []):
-        k = item.get("key")
-        if k:
-            desired[str(k)] = str(item.get("value", ""))
-    for item in (p2_list or []):
-        k = item.get("key")
-        if k:
-            desired[str(k) + "P2"] = str(item.get("value", ""))
+    for items, suffix in ((p1_list, ""), (p2_list, "P2")):
+        for item in (items or []):
+            k = item.get("key")
+            if k:
+                desired[f"{k}{suffix}"] = str(item.get("value", ""))
     return desired
 
 
-def _detect_add_indentation(text: str) -> str:
-    for line in text.splitlines(True):
-        if "<add" in line:
-            m = re.match(r"^([ \t]*)<add\b", line)
-            if m:
-                return m.group(1)
-    return "    "
+def _detect_add_indentation(data: bytes) -> bytes:
+    m = _ADD_INDENT_RE.search(data)
+    return m.group(1) if m else b"    "
 
 
-def update_config_preserve_layout(path: str, p1_list, p2_list) -> None:
+def update_config_preserve_layout(path: str, p1_list, p2_list) -> bool:
     desired = _build_desired_map(p1_list, p2_list)
-    if not os.path.exists(path):
-        _ensure_stub(path)
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
+    _ensure_stub(path)
+    with open(path, "rb") as f:
         original = f.read()
-    updated = original
+    # Only the keys and values being written are encoded (and each value
+    # escaped) once, up front; the rest of the file is never decoded.
+    encoded: Dict[bytes, Tuple[str, bytes]] = {
+        k.encode("utf-8"): (k, _xml_escape_attr(v).encode("utf-8")) for k, v in desired.items()
+    }
     found_keys = set()
+    edits: List[Tuple[int, int, bytes]] = []
 
-    def patch_add_tag(match: re.Match) -> str:
-        tag = match.group(0)
-        key_m = re.search(r"\bkey\s*=\s*(['\"])(.*?)\1", tag, re.IGNORECASE)
-        if not key_m:
-            return tag
-        key = key_m.group(2)
-        if key not in desired:
-            return tag
+    for m in _ADD_KV_RE.finditer(original):
+        hit = encoded.get(m.group("key"))
+        if hit is None:
+            continue
+        key, new_val = hit
         found_keys.add(key)
-        new_val = _xml_escape_attr(desired[key])
-        val_m = re.search(r"\bvalue\s*=\s*(['\"])(.*?)\1", tag, re.IGNORECASE)
-        if val_m:
-            start, end = val_m.span(2)
-            return tag[:start] + new_val + tag[end:]
-        insert_at = key_m.end(0)
-        return tag[:insert_at] + f' value="{new_val}"' + tag[insert_at:]
-
-    updated = _ADD_TAG_RE.sub(patch_add_tag, updated)
-    missing = [k for k in desired.keys() if k not in found_keys]
+        if m.group("vq") is not None:
+            if m.group("val") != new_val:
+                edits.append((m.start("val"), m.end("val"), new_val))
+        else:
+            insert_at = m.end("key") + 1
+            edits.append((insert_at, insert_at, b' value="' + new_val + b'"'))
+
+    missing = [(k, v) for k, v in encoded.values() if k not in found_keys]
     if missing:
-        indent = _detect_add_indentation(updated)
-        close_m = re.search(r"</appSettings\s*>", updated, re.IGNORECASE)
+        indent = _detect_add_indentation(original)
+        close_m = _APPSETTINGS_CLOSE_RE.search(original)
         if not close_m:
             raise ValueError("Could not locate </appSettings> in config; refusing to insert missing keys.")
         insert_pos = close_m.start()
-        newline = "\r\n" if "\r\n" in updated else "\n"
+        newline = b"\r\n" if b"\r\n" in original else b"\n"
         insertion_lines = []
-        for k in missing:
-            v = _xml_escape_attr(desired[k])
-            insertion_lines.append(f'{indent}<add key="{_xml_escape_attr(k)}" value="{v}" />')
-        insertion = newline + "\n".join(insertion_lines) + newline
-        updated = updated[:insert_pos] + insertion + updated[insert_pos:]
-
-    if updated != original:
-        with open(path, "w", encoding="utf-8", newline="") as f:
+        for k, v in missing:
+            insertion_lines.append(indent + f'<add key="{_xml_escape_attr(k)}" value="'.encode("utf-8") + v + b'" />')
+        insertion = newline + newline.join(insertion_lines) + newline
+        edits.append((insert_pos, insert_pos, insertion))
+
+    if not edits:
+        return False
+
+    # Splice every edit into the original text in one pass.
+    edits.sort(key=itemgetter(0))
+    parts: List[bytes] = []
+    pos = 0
+    for start, end, text in edits:
+        parts.append(original[pos:start])
+        parts.append(text)
+        pos = end
+    parts.append(original[pos:])
+    updated = b"".join(parts)
+
+    tmp_path = _tmp_path_for(path)
+    try:
+        with open(tmp_path, "wb") as f:
             f.write(updated)
+            f.flush()
+            # Data must be on disk before the rename, or a crash can leave
+            # an empty config behind the new name.
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
 
 
 CATEGORIES = [
@@ -1094,57 +1461,77 @@ CATEGORIES = [
 ]
 
 
+_CATEGORIES_COMPILED = [(re.compile(pat), name) for pat, name in CATEGORIES]
+
+
+@functools.lru_cache(maxsize=1024)
 def _category_for(key: str) -> str:
-    for pat, name in CATEGORIES:
-        if re.search(pat, key):
+    for rx, name in _CATEGORIES_COMPILED:
+        if rx.search(key):
             return name
     return 'Other'
 
 
-def _settings_with_comments(appsettings: ET.Element):
-    children = list(appsettings)
-    out = []
-    for i, el in enumerate(children):
-        if not (isinstance(el.tag, str) and el.tag == "add"):
-            continue
-        key = el.attrib.get("key", "")
-        val = el.attrib.get("value", "")
-        comment_text = ""
-        if i + 1 < len(children) and children[i + 1].tag is ET.Comment:
-            comment_text = (children[i + 1].text or "").strip()
-        elif i - 1 >= 0 and children[i - 1].tag is ET.Comment:
-            comment_text = (children[i - 1].text or "").strip()
-        out.append({"key": key, "value": val, "comment": comment_text})
-    return out
+_BUCKET_NAMES = [name for _, name in CATEGORIES] + ['Other']
 
 
 def _group_by_category(items):
-    buckets = OrderedDict([(name, []) for _, name in CATEGORIES] + [('Other', [])])
+    buckets = {name: [] for name in _BUCKET_NAMES}
     for it in items:
         buckets[_category_for(it['key'])].append(it)
     return [{"name": k, "items": v} for k, v in buckets.items() if v]
 
 
 def _split_by_player(appsettings: ET.Element):
-    items = _settings_with_comments(appsettings)
+    # One pass over the children: each <add> picks up the comment next to it
+    # and goes straight into the player 1 or player 2 list.
+    children = list(appsettings)
+    last = len(children) - 1
     p1 = []
     p2 = []
-    for it in items:
-        k = it["key"]
-        if k.endswith("P2"):
-            p2.append({"key": k[:-2], "value": it["value"], "comment": it["comment"]})
+    for i, el in enumerate(children):
+        if el.tag != "add":
+            continue
+        attrib = el.attrib
+        key = attrib.get("key", "")
+        comment_text = ""
+        if i < last and children[i + 1].tag is XML.Comment:
+            comment_text = (children[i + 1].text or "").strip()
+        elif i > 0 and children[i - 1].tag is XML.Comment:
+            comment_text = (children[i - 1].text or "").strip()
+        if key.endswith("P2"):
+            p2.append({"key": key[:-2], "value": attrib.get("value", ""), "comment": comment_text})
         else:
-            p1.append({"key": k, "value": it["value"], "comment": it["comment"]})
+            p1.append({"key": key, "value": attrib.get("value", ""), "comment": comment_text})
     return p1, p2, _group_by_category(p1), _group_by_category(p2)
 
 
+_CFG_CACHE: Dict[str, Tuple[Tuple[int, int, int], tuple]] = {}
+
+
+def _config_view(path: str) -> tuple:
+    # Parsed (p1, p2, p1_groups, p2_groups), reused until the file changes.
+    # st_ino is in the key because writes land by rename, which another
+    # worker sees as a new inode even within one mtime tick.
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _ensure_stub(path)
+        st = os.stat(path)
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _CFG_CACHE.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    view = _split_by_player(_appsettings_root(_load_config_tree(path)))
+    _CFG_CACHE[path] = (key, view)
+    return view
+
+
 PROFILE_NAME_RE = re.compile(r"^[A-Za-z0-9_-]{1,60}$")
 
 
-def _profiles_dir_for(path: str) -> str:
-    pdir = os.path.join(os.path.dirname(path), "profiles")
-    os.makedirs(pdir, exist_ok=True)
-    return pdir
+def _profiles_dir_for(platform: str) -> str:
+    return _PLATFORM_META[_resolve_platform(platform)][3]
 
 
 def _safe_profile_name(name: str) -> str:
@@ -1156,29 +1543,59 @@ def _safe_profile_name(name: str) -> str:
 
 
 def _profile_path(platform: str, name: str) -> str:
-    platform = _resolve_platform(platform)
-    live_cfg = CONFIG_PATHS[platform]
-    pdir = _profiles_dir_for(live_cfg)
+    pdir = _profiles_dir_for(platform)
     return os.path.join(pdir, f"{_safe_profile_name(name)}.config")
 
 
-def _list_profiles(platform: str) -> List[Dict[str, str]]:
-    platform = _resolve_platform(platform)
-    live_cfg = CONFIG_PATHS[platform]
-    pdir = _profiles_dir_for(live_cfg)
-    items: List[Dict[str, str]] = []
-    if os.path.isdir(pdir):
-        for fname in os.listdir(pdir):
-            if not fname.endswith(".config"):
+_LIST_CACHE: Dict[str, Tuple[int, List[Dict]]] = {}
+_LIST_LOCK = threading.Lock()
+# A directory changed this recently may change again within the same
+# timestamp tick, so its listing is not cached yet.
+_LIST_RACY_NS = 2_000_000_000
+
+
+def _cached_listing(directory: str, build) -> List[Dict]:
+    # Rebuilt only when the directory's own mtime moves (entry added,
+    # removed or renamed). Every write handler creates, renames or unlinks
+    # an entry, so this also holds across gunicorn workers.
+    try:
+        st = os.stat(directory)
+    except FileNotFoundError:
+        return []
+    with _LIST_LOCK:
+        hit = _LIST_CACHE.get(directory)
+        if hit and hit[0] == st.st_mtime_ns:
+            return hit[1]
+    items = build(directory)
+    if time.time_ns() - st.st_mtime_ns > _LIST_RACY_NS:
+        with _LIST_LOCK:
+            _LIST_CACHE[directory] = (st.st_mtime_ns, items)
+    return items
+
+
+def _scan_profiles(pdir: str) -> List[Dict]:
+    # is_file() and stat() both follow symlinks, so a symlinked profile is
+    # listed with its target's mtime; for regular files DirEntry reuses the
+    # lstat result and no extra syscall is made.
+    found: List[Tuple[int, Dict[str, str]]] = []
+    with os.scandir(pdir) as it:
+        for entry in it:
+            if not entry.name.endswith(".config"):
                 continue
-            full = os.path.join(pdir, fname)
             try:
-                st = os.stat(full)
-                items.append({"name": os.path.splitext(fname)[0], "path": full, "mtime": int(st.st_mtime)})
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                found.append((st.st_mtime_ns, {"name": entry.name[:-7], "path": entry.path, "mtime": st.st_mtime_ns // 1_000_000_000}))
             except FileNotFoundError:
                 pass
-    items.sort(key=lambda x: x["mtime"], reverse=True)
-    return items
+    # Sort on nanoseconds; whole seconds are only what the UI is sent.
+    found.sort(key=itemgetter(0), reverse=True)
+    return [item for _, item in found]
+
+
+def _list_profiles(platform: str) -> List[Dict[str, str]]:
+    return _cached_listing(_profiles_dir_for(platform), _scan_profiles)
 
 
 @app.route("/api/config", methods=["GET"])
@@ -1192,9 +1609,7 @@ def api_config_get():
         else:
             path = CONFIG_PATHS[platform]
             source = "live"
-        tree = _load_config_tree(path)
-        appsettings = _appsettings_root(tree)
-        p1, p2, p1_groups, p2_groups = _split_by_player(appsettings)
+        p1, p2, p1_groups, p2_groups = _config_view(path)
         return jsonify({
             "ok": True,
             "platform": platform,
@@ -1220,19 +1635,21 @@ def api_config_save():
         p1_list = data.get("player1", [])
         p2_list = data.get("player2", [])
 
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        cfg_dir = os.path.dirname(path)
-        cfg_base = os.path.basename(path)
-        backup_dir = os.path.join(cfg_dir, "backups")
-        os.makedirs(backup_dir, exist_ok=True)
-        backup_path = os.path.join(backup_dir, f"{cfg_base}.{ts}.bak")
-
-        if not os.path.exists(path):
-            _ensure_stub(path)
-        with open(path, "rb") as src, open(backup_path, "wb") as dst:
-            dst.write(src.read())
+        _ensure_stub(path)
+        backup_path, linked = _take_backup(platform, path)
 
-        update_config_preserve_layout(path, p1_list, p2_list)
+        changed = False
+        try:
+            changed = update_config_preserve_layout(path, p1_list, p2_list)
+        finally:
+            if linked and not changed:
+                # The live inode was not replaced; give the backup its own,
+                # swapped in by rename so the name is never free for another
+                # save to claim.
+                tmp_path = _tmp_path_for(backup_path)
+                shutil.copyfile(path, tmp_path)
+                os.replace(tmp_path, backup_path)
+        _CFG_CACHE.pop(path, None)
         return jsonify({"ok": True, "platform": platform, "path": path, "backup": backup_path})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
@@ -1257,21 +1674,47 @@ def api_profile_save():
         live_path = CONFIG_PATHS[platform]
         prof_path = _profile_path(platform, name)
 
-        if not os.path.exists(live_path):
-            _ensure_stub(live_path)
+        _ensure_stub(live_path)
         if os.path.exists(prof_path) and not overwrite:
             return jsonify({"ok": False, "error": "Profile already exists"}), 409
 
         os.makedirs(os.path.dirname(prof_path), exist_ok=True)
-        with open(live_path, "rb") as src, open(prof_path, "wb") as dst:
-            dst.write(src.read())
-
-        os.chmod(prof_path, 0o664)
+        # Written via rename so an overwrite also moves the directory mtime
+        # the listing cache is keyed on.
+        tmp_path = _tmp_path_for(prof_path)
+        try:
+            shutil.copyfile(live_path, tmp_path)
+            os.chmod(tmp_path, 0o664)
+            os.replace(tmp_path, prof_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        _CFG_CACHE.pop(prof_path, None)
         return jsonify({"ok": True, "platform": platform, "profile": name, "path": prof_path})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 400
 
 
+def _replace_with_backup(src_path: str, live_path: str, platform: str, kind: str = "") -> str:
+    # The backup is a hardlink to the current live inode and the new content
+    # lands on a fresh inode via rename, so only one file's data is copied.
+    backup_path, linked = _take_backup(platform, live_path, kind)
+    tmp_path = _tmp_path_for(live_path)
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        _fsync_file(tmp_path)
+        os.replace(tmp_path, live_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if linked:
+            # Never leave the backup sharing an inode with the live file.
+            os.remove(backup_path)
+        raise
+    return backup_path
+
+
 @app.route("/api/config/profile/load", methods=["POST"])
 def api_profile_load():
     try:
@@ -1283,20 +1726,10 @@ def api_profile_load():
         prof_path = _profile_path(platform, name)
         if not os.path.exists(prof_path):
             return jsonify({"ok": False, "error": "Profile not found"}), 404
-        if not os.path.exists(live_path):
-            _ensure_stub(live_path)
-
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        cfg_dir = os.path.dirname(live_path)
-        cfg_base = os.path.basename(live_path)
-        backup_dir = os.path.join(cfg_dir, "backups")
-        os.makedirs(backup_dir, exist_ok=True)
-        backup_path = os.path.join(backup_dir, f"{cfg_base}.{ts}.bak")
+        _ensure_stub(live_path)
 
-        with open(live_path, "rb") as src, open(backup_path, "wb") as dst:
-            dst.write(src.read())
-        with open(prof_path, "rb") as src, open(live_path, "wb") as dst:
-            dst.write(src.read())
+        backup_path = _replace_with_backup(prof_path, live_path, platform)
+        _CFG_CACHE.pop(live_path, None)
 
         os.chmod(live_path, 0o664)
         return jsonify({"ok": True, "platform": platform, "profile": name, "path": live_path, "backup": backup_path})
@@ -1316,18 +1749,65 @@ def api_profile_delete():
             return jsonify({"ok": False, "error": "Profile not found"}), 404
 
         os.remove(prof_path)
+        _CFG_CACHE.pop(prof_path, None)
         return jsonify({"ok": True, "platform": platform, "profile": name})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 400
 
 
 def _backup_dir_for_platform(platform: str) -> Tuple[str, str, str]:
-    platform = _resolve_platform(platform)
-    live_path = CONFIG_PATHS[platform]
-    cfg_dir = os.path.dirname(live_path)
-    backup_dir = os.path.join(cfg_dir, "backups")
+    backup_dir, cfg_base, live_path, _ = _PLATFORM_META[_resolve_platform(platform)]
+    return backup_dir, cfg_base, live_path
+
+
+def _take_backup(platform: str, src: str, kind: str = "") -> Tuple[str, bool]:
+    # <cfg>.<timestamp><kind>.bak, with -1, -2, ... appended when a backup was
+    # already taken in the same second. The link/copy itself claims the name,
+    # so two workers saving at once can never overwrite each other's backup.
+    backup_dir, cfg_base, _ = _backup_dir_for_platform(platform)
     os.makedirs(backup_dir, exist_ok=True)
-    return backup_dir, os.path.basename(live_path), live_path
+    stem = os.path.join(backup_dir, f"{cfg_base}.{time.strftime('%Y%m%d-%H%M%S')}{kind}")
+    path = f"{stem}.bak"
+    n = 1
+    while True:
+        try:
+            return path, _link_or_copy(src, path)
+        except FileExistsError:
+            path = f"{stem}-{n}.bak"
+            n += 1
+
+
+def _ensure_config_dirs() -> None:
+    # Created once per worker; write handlers still makedirs before use
+    # in case a directory is removed while the dashboard is running.
+    for backup_dir, _, _, profiles_dir in _PLATFORM_META.values():
+        for d in (backup_dir, profiles_dir):
+            try:
+                os.makedirs(d, exist_ok=True)
+            except OSError:
+                pass
+
+
+_ensure_config_dirs()
+
+
+def _scan_backups(backup_dir: str, cfg_base: str) -> List[Dict]:
+    # ctime, not mtime: a hardlinked backup keeps the mtime of whenever that
+    # config was last written, while link() bumps ctime to the backup time.
+    found: List[Tuple[int, Dict[str, str]]] = []
+    prefix = cfg_base + "."
+    with os.scandir(backup_dir) as it:
+        for entry in it:
+            fname = entry.name
+            if not (fname.startswith(prefix) and fname.endswith(".bak")):
+                continue
+            try:
+                st = entry.stat()
+                found.append((st.st_ctime_ns, {"name": fname, "path": entry.path, "mtime": st.st_ctime_ns // 1_000_000_000, "size": st.st_size}))
+            except FileNotFoundError:
+                pass
+    found.sort(key=itemgetter(0), reverse=True)
+    return [item for _, item in found]
 
 
 @app.route("/api/config/backups", methods=["GET"])
@@ -1335,18 +1815,7 @@ def api_backup_list():
     try:
         platform = _resolve_platform(request.args.get("platform"))
         backup_dir, cfg_base, _ = _backup_dir_for_platform(platform)
-        items: List[Dict[str, str]] = []
-        if os.path.isdir(backup_dir):
-            for fname in os.listdir(backup_dir):
-                if not (fname.startswith(cfg_base + ".") and fname.endswith(".bak")):
-                    continue
-                full = os.path.join(backup_dir, fname)
-                try:
-                    st = os.stat(full)
-                    items.append({"name": fname, "path": full, "mtime": int(st.st_mtime), "size": st.st_size})
-                except FileNotFoundError:
-                    pass
-        items.sort(key=lambda x: x["mtime"], reverse=True)
+        items = _cached_listing(backup_dir, lambda d: _scan_backups(d, cfg_base))
         return jsonify({"ok": True, "platform": platform, "backups": items})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 400
@@ -1368,15 +1837,10 @@ def api_backup_restore():
         src_path = os.path.join(backup_dir, filename)
         if not os.path.exists(src_path):
             return jsonify({"ok": False, "error": "Backup not found"}), 404
-        if not os.path.exists(live_path):
-            _ensure_stub(live_path)
+        _ensure_stub(live_path)
 
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        safety_backup = os.path.join(backup_dir, f"{cfg_base}.{ts}.restore.bak")
-        with open(live_path, "rb") as src, open(safety_backup, "wb") as dst:
-            dst.write(src.read())
-        with open(src_path, "rb") as src, open(live_path, "wb") as dst:
-            dst.write(src.read())
+        safety_backup = _replace_with_backup(src_path, live_path, platform, ".restore")
+        _CFG_CACHE.pop(live_path, None)
 
         os.chmod(live_path, 0o664)
         return jsonify({"ok": True, "platform": platform, "path": live_path, "restored_from": src_path, "safety_backup": safety_backup})
@@ -1386,79 +1850,82 @@ def api_backup_restore():
 # ===========================
 # Logo App Routes
 # ===========================
+# Browsers keep these for a day, then revalidate against ETag/Last-Modified.
+STATIC_MAX_AGE = 86400
 
 @app.route("/logo.png")
 def logo():
-    return send_from_directory("/opt/lightgun-dashboard", "logo.png")
+    return send_from_directory("/opt/lightgun-dashboard", "logo.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/ps1.png")
 def ps1_png():
-    return send_from_directory("/opt/lightgun-dashboard", "ps1.png")
+    return send_from_directory("/opt/lightgun-dashboard", "ps1.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/ps1-u.png")
 def ps1u_png():
-    return send_from_directory("/opt/lightgun-dashboard", "ps1-u.png")
+    return send_from_directory("/opt/lightgun-dashboard", "ps1-u.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/ps2.png")
 def ps2_png():
-    return send_from_directory("/opt/lightgun-dashboard", "ps2.png")
+    return send_from_directory("/opt/lightgun-dashboard", "ps2.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/ps2-u.png")
 def ps2u_png():
-    return send_from_directory("/opt/lightgun-dashboard", "ps2-u.png")
+    return send_from_directory("/opt/lightgun-dashboard", "ps2-u.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/load.png")
 def load_png():
-    return send_from_directory("/opt/lightgun-dashboard", "load.png")
+    return send_from_directory("/opt/lightgun-dashboard", "load.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/offline.png")
 def offline_png():
-    return send_from_directory("/opt/lightgun-dashboard", "offline.png")
+    return send_from_directory("/opt/lightgun-dashboard", "offline.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/hb.png")
 def hb_png():
-    return send_from_directory("/opt/lightgun-dashboard", "hb.png")
+    return send_from_directory("/opt/lightgun-dashboard", "hb.png", conditional=True, max_age=STATIC_MAX_AGE)
     
 @app.route("/hb-u.png")
 def hbu_png():
-    return send_from_directory("/opt/lightgun-dashboard", "hb-u.png")
+    return send_from_directory("/opt/lightgun-dashboard", "hb-u.png", conditional=True, max_age=STATIC_MAX_AGE)
     
 @app.route("/favicon.ico")
 def favicon_ico():
-    return send_from_directory("/opt/lightgun-dashboard", "favicon.ico")
+    return send_from_directory("/opt/lightgun-dashboard", "favicon.ico", conditional=True, max_age=STATIC_MAX_AGE)
     
 @app.route("/apple-touch-icon.png")
 def apple_touch_icon():
-    return send_from_directory("/opt/lightgun-dashboard", "apple-touch-icon.png")
+    return send_from_directory("/opt/lightgun-dashboard", "apple-touch-icon.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/manifest.json")
 def manifest_json():
-    return send_from_directory("/opt/lightgun-dashboard", "manifest.json")
+    return send_from_directory("/opt/lightgun-dashboard", "manifest.json", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/pal.png")
 def pal_png():
-    return send_from_directory("/opt/lightgun-dashboard", "pal.png")
+    return send_from_directory("/opt/lightgun-dashboard", "pal.png", conditional=True, max_age=STATIC_MAX_AGE)
     
 @app.route("/analog.png")
 def analog_png():
-    return send_from_directory("/opt/lightgun-dashboard", "analog.png")
+    return send_from_directory("/opt/lightgun-dashboard", "analog.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/sony.png")
 def sony_png():
-    return send_from_directory("/opt/lightgun-dashboard", "sony.png")
+    return send_from_directory("/opt/lightgun-dashboard", "sony.png", conditional=True, max_age=STATIC_MAX_AGE)
     
 @app.route("/ntsc.png")
 def ntsc_png():
-    return send_from_directory("/opt/lightgun-dashboard", "ntsc.png")
+    return send_from_directory("/opt/lightgun-dashboard", "ntsc.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/dht.png")
 def dht_png():
-    return send_from_directory("/opt/lightgun-dashboard", "dht.png")
+    return send_from_directory("/opt/lightgun-dashboard", "dht.png", conditional=True, max_age=STATIC_MAX_AGE)
 
 @app.route("/")
 def index():
-    with open("/opt/lightgun-dashboard/index.html", "r", encoding="utf-8") as f:
-        return render_template_string(f.read())
+    # index.html has no template tags; serve it as a file so browsers get
+    # a 304 on reload instead of the whole page.
+    return send_from_directory("/opt/lightgun-dashboard", "index.html", conditional=True)
 
 
 @app.route("/api/version")
@@ -1525,9 +1992,13 @@ def api_iconset_save():
             "error": str(e)
         }), 400
 
+_HEALTHZ_BODY = b'{"ok":true}'
+
+
 @app.route("/healthz")
 def healthz():
-    return jsonify({"ok": True}), 200
+    # Pre-encoded; liveness probes skip the JSON encoder entirely.
+    return app.response_class(_HEALTHZ_BODY, status=200, mimetype="application/json")
 
 
 if __name__ == "__main__":
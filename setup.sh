@@ -555,6 +555,8 @@ PY_BIN="python3"
 SYSTEMCTL="/usr/bin/systemctl"
 SUDO="/usr/bin/sudo"
 GUNICORN_BIND="0.0.0.0:5000"
+GUNICORN_THREADS="4"
+GUNICORN_KEEPALIVE="5"
 
 # PS config files
 CFG_PS1="/home/${APP_USER}/Lightgun/PS1/LightgunMono.exe.config"
@@ -566,7 +568,7 @@ SINDEN_LOG_FILE="${SINDEN_LOG_DIR}/sinden.log"
 
 log "=== 1) Install OS packages ==="
 sudo apt-get update -y
-sudo apt-get install -y python3 python3-pip python3-venv git nginx wget lsof jq
+sudo apt-get install -y python3 python3-pip python3-venv python3-dev pkg-config libsystemd-dev git nginx wget lsof jq
 
 log "=== 2) Ensure app directory and ownership ==="
 sudo mkdir -p "${APP_DIR}"
@@ -583,6 +585,12 @@ fi
 source "${VENV_DIR}/bin/activate"
 pip install --upgrade pip
 pip install "flask==3.*" "gunicorn==21.*"
+pip install lxml || log "lxml unavailable; dashboard will parse configs with ElementTree"
+pip install pystemd || log "pystemd unavailable; dashboard will query systemctl instead"
+pip install systemd-python || log "systemd-python unavailable; dashboard will read service logs via systemctl"
+# Without this the journal only shows the dashboard user its own entries.
+sudo usermod -aG systemd-journal "${APP_USER}" || log "Could not add ${APP_USER} to systemd-journal; service logs will come from systemctl"
+pip install orjson || log "orjson unavailable; dashboard will use the standard json encoder"
 
 log "=== 4) Backend: Flask app  ==="
 sudo wget -O ${APP_DIR}/app.py \
@@ -612,7 +620,7 @@ After=network.target
 User=${APP_USER}
 WorkingDirectory=${APP_DIR}
 Environment="PATH=/usr/bin:/bin:/usr/sbin:/sbin:${VENV_DIR}/bin"
-ExecStart=${VENV_DIR}/bin/gunicorn -w 2 -b ${GUNICORN_BIND} app:app
+ExecStart=${VENV_DIR}/bin/gunicorn -w 2 -k gthread --threads ${GUNICORN_THREADS} --keep-alive ${GUNICORN_KEEPALIVE} -b ${GUNICORN_BIND} app:app
 Restart=always
 
 [Install]